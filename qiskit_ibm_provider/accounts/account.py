@@ -13,6 +13,7 @@
 """Account related classes and functions."""
 
 import logging
+import re
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -22,11 +23,11 @@ from typing_extensions import Literal
 from .exceptions import InvalidAccountError
 from ..api.auth import QuantumAuth
 from ..proxies import ProxyConfiguration
-from ..utils.hgp import from_instance_format
 
 ChannelType = Optional[Literal["ibm_quantum"]]
 
 IBM_QUANTUM_API_URL = "https://auth.quantum-computing.ibm.com/api"
+_HGP_INSTANCE_RE = re.compile(r"[^/]+/[^/]+/[^/]+")
 logger = logging.getLogger(__name__)
 
 
@@ -88,15 +89,13 @@ class Account:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Account):
             return False
-        return all(
-            [
-                self.channel == other.channel,
-                self.token == other.token,
-                self.url == other.url,
-                self.instance == other.instance,
-                self.proxies == other.proxies,
-                self.verify == other.verify,
-            ]
+        return (
+            self.channel == other.channel
+            and self.token == other.token
+            and self.url == other.url
+            and self.instance == other.instance
+            and self.proxies == other.proxies
+            and self.verify == other.verify
         )
 
     def validate(self) -> "Account":
@@ -152,10 +151,9 @@ class Account:
     @staticmethod
     def _assert_valid_instance(instance: str) -> None:
         """Assert that the instance name is valid for the given account type."""
-        if instance is not None:
-            try:
-                from_instance_format(instance)
-            except:
-                raise InvalidAccountError(
-                    f"Invalid `instance` value. Expected hub/group/project format, got {instance}"
-                )
+        if instance is not None and not (
+            isinstance(instance, str) and _HGP_INSTANCE_RE.fullmatch(instance)
+        ):
+            raise InvalidAccountError(
+                f"Invalid `instance` value. Expected hub/group/project format, got {instance}"
+            )
@@ -29,6 +29,9 @@ class AccountManager:
     _default_account_name = "default"
     _default_account_name_legacy = "default-legacy"
     _default_account_name_ibm_quantum = "default-ibm-quantum"
+    _default_account_names = frozenset(
+        {_default_account_name, _default_account_name_ibm_quantum}
+    )
     _default_channel_type = "ibm_quantum"
 
     @classmethod
@@ -44,22 +47,35 @@ class AccountManager:
         overwrite: Optional[bool] = False,
     ) -> None:
         """Save account on disk."""
-        cls.migrate()
-        name = name or cls._default_account_name_ibm_quantum
-        return save_config(
-            filename=cls._default_account_config_json_file,
-            name=name,
-            overwrite=overwrite,
-            config=Account(
+        return cls.save_account(
+            Account(
                 token=token,
                 url=url,
                 instance=instance,
                 channel=channel,
                 proxies=proxies,
                 verify=verify,
-            )
+            ),
+            name=name,
+            overwrite=overwrite,
+        )
+
+    @classmethod
+    def save_account(
+        cls,
+        account: Account,
+        name: Optional[str] = None,
+        overwrite: Optional[bool] = False,
+    ) -> None:
+        """Save an account instance on disk."""
+        cls.migrate()
+        name = name or cls._default_account_name_ibm_quantum
+        return save_config(
+            filename=cls._default_account_config_json_file,
+            name=name,
+            overwrite=overwrite,
             # avoid storing invalid accounts
-            .validate().to_saved_format(),
+            config=account.validate().to_saved_format(),
         )
 
     @classmethod
@@ -70,7 +86,7 @@ class AccountManager:
         name: Optional[str] = None,
     ) -> Dict[str, Account]:
         """List all accounts saved on disk."""
-        AccountManager.migrate()
+        all_config = AccountManager.migrate()
 
         def _matching_name(account_name: str) -> bool:
             return name is None or name == account_name
@@ -79,37 +95,21 @@ class AccountManager:
             return channel is None or account.channel == channel
 
         def _matching_default(account_name: str) -> bool:
-            default_accounts = [
-                cls._default_account_name,
-                cls._default_account_name_ibm_quantum,
-            ]
             if default is None:
                 return True
             elif default is False:
-                return account_name not in default_accounts
+                return account_name not in cls._default_account_names
             else:
-                return account_name in default_accounts
-
-        # load all accounts
-        all_accounts = map(
-            lambda kv: (
-                kv[0],
-                Account.from_saved_format(kv[1]),
-            ),
-            read_config(filename=cls._default_account_config_json_file).items(),
-        )
+                return account_name in cls._default_account_names
 
-        # filter based on input parameters
-        filtered_accounts = dict(
-            list(
-                filter(
-                    lambda kv: _matching_channel(kv[1])
-                    and _matching_default(kv[0])
-                    and _matching_name(kv[0]),
-                    all_accounts,
-                )
-            )
-        )
+        # filter based on input parameters, only loading the matching accounts
+        filtered_accounts: Dict[str, Account] = {}
+        for account_name, saved_account in all_config.items():
+            if not (_matching_name(account_name) and _matching_default(account_name)):
+                continue
+            account = Account.from_saved_format(saved_account)
+            if _matching_channel(account):
+                filtered_accounts[account_name] = account
 
         return filtered_accounts
 
@@ -129,11 +129,9 @@ class AccountManager:
         Raises:
             AccountNotFoundError: If the input value cannot be found on disk.
         """
-        cls.migrate()
+        all_config = cls.migrate()
         if name:
-            saved_account = read_config(
-                filename=cls._default_account_config_json_file, name=name
-            )
+            saved_account = all_config.get(name)
             if not saved_account:
                 raise AccountNotFoundError(
                     f"Account with the name {name} does not exist on disk."
@@ -146,15 +144,11 @@ class AccountManager:
             return env_account
 
         if channel:
-            saved_account = read_config(
-                filename=cls._default_account_config_json_file,
-                name=cls._default_account_name_ibm_quantum,
-            )
+            saved_account = all_config.get(cls._default_account_name_ibm_quantum)
             if saved_account is None:
                 raise AccountNotFoundError(f"No default {channel} account saved.")
             return Account.from_saved_format(saved_account)
 
-        all_config = read_config(filename=cls._default_account_config_json_file)
         account_name = cls._default_account_name_ibm_quantum
         if account_name in all_config:
             return Account.from_saved_format(all_config[account_name])
@@ -172,11 +166,17 @@ class AccountManager:
         return delete_config(name=name, filename=cls._default_account_config_json_file)
 
     @classmethod
-    def migrate(cls) -> None:
-        """Migrate accounts on disk by removing `auth` and adding `channel`."""
+    def migrate(cls) -> Dict[str, Dict]:
+        """Migrate accounts on disk by removing `auth` and adding `channel`.
+
+        Returns:
+            The configuration data saved on disk, after the migration.
+        """
         data = read_config(filename=cls._default_account_config_json_file)
+        migrated = False
         for key, value in data.items():
             if key == cls._default_account_name_legacy:
+                migrated = True
                 value.pop("auth", None)
                 value.update(channel="ibm_quantum")
                 delete_config(filename=cls._default_account_config_json_file, name=key)
@@ -188,6 +188,7 @@ class AccountManager:
                 )
             else:
                 if hasattr(value, "auth"):
+                    migrated = True
                     if value["auth"] == "legacy":
                         value.update(channel="ibm_quantum")
                     value.pop("auth", None)
@@ -197,6 +198,9 @@ class AccountManager:
                         config=value,
                         overwrite=True,
                     )
+        if migrated:
+            data = read_config(filename=cls._default_account_config_json_file)
+        return data
 
     @classmethod
     def _from_env_variables(cls, channel: Optional[ChannelType]) -> Optional[Account]:
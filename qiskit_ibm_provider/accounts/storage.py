@@ -25,9 +25,7 @@ def save_config(filename: str, name: str, config: dict, overwrite: bool) -> None
     """Save configuration data in a JSON file under the given name."""
     logger.debug("Save configuration data for '%s' in '%s'", name, filename)
     _ensure_file_exists(filename)
-
-    with open(filename, mode="r", encoding="utf-8") as json_in:
-        data = json.load(json_in)
+    data = _read_json(filename)
 
     if data.get(name) and not overwrite:
         raise AccountAlreadyExistsError(
@@ -35,9 +33,8 @@ def save_config(filename: str, name: str, config: dict, overwrite: bool) -> None
             f"Set overwrite=True to overwrite."
         )
 
-    with open(filename, mode="w", encoding="utf-8") as json_out:
-        data[name] = config
-        json.dump(data, json_out, sort_keys=True, indent=4)
+    data[name] = config
+    _write_json(filename, data)
 
 
 def read_config(
@@ -48,13 +45,12 @@ def read_config(
     logger.debug("Read configuration data for '%s' from '%s'", name, filename)
     _ensure_file_exists(filename)
 
-    with open(filename, encoding="utf-8") as json_file:
-        data = json.load(json_file)
-        if name is None:
-            return data
-        if name in data:
-            return data[name]
-        return None
+    data = _read_json(filename)
+    if name is None:
+        return data
+    if name in data:
+        return data[name]
+    return None
 
 
 def delete_config(
@@ -66,18 +62,28 @@ def delete_config(
     logger.debug("Delete configuration data for '%s' from '%s'", name, filename)
 
     _ensure_file_exists(filename)
-    with open(filename, mode="r", encoding="utf-8") as json_in:
-        data = json.load(json_in)
+    data = _read_json(filename)
 
     if name in data:
-        with open(filename, mode="w", encoding="utf-8") as json_out:
-            del data[name]
-            json.dump(data, json_out, sort_keys=True, indent=4)
-            return True
+        del data[name]
+        _write_json(filename, data)
+        return True
 
     return False
 
 
+def _read_json(filename: str) -> Dict:
+    """Read data from a JSON file."""
+    with open(filename, mode="r", encoding="utf-8") as json_in:
+        return json.load(json_in)
+
+
+def _write_json(filename: str, data: Dict) -> None:
+    """Write data to a JSON file."""
+    with open(filename, mode="w", encoding="utf-8") as json_out:
+        json.dump(data, json_out, sort_keys=True, indent=4)
+
+
 def _ensure_file_exists(filename: str, initial_content: str = "{}") -> None:
     if not os.path.isfile(filename):
         logger.debug("Create empty configuration file at %s", filename)
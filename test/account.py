@@ -12,16 +12,22 @@
 
 """Context managers for using with IBM Provider unit tests."""
 
+import itertools
 import json
 import os
-import uuid
-from contextlib import ContextDecorator
-from tempfile import NamedTemporaryFile
+import secrets
+from contextlib import ContextDecorator, contextmanager
 from unittest.mock import patch
 
-from qiskit_ibm_provider.accounts import AccountManager
+from qiskit_ibm_provider.accounts import AccountManager, AccountAlreadyExistsError
 from qiskit_ibm_provider.accounts.account import IBM_QUANTUM_API_URL
 
+# Pool of 32 dummy tokens, generated with a single call to the random source.
+_RANDOM_HEX = secrets.token_hex(16 * 32)
+_DUMMY_TOKENS = itertools.cycle(
+    [_RANDOM_HEX[i : i + 32] for i in range(0, len(_RANDOM_HEX), 32)]
+)
+
 
 class custom_envs(ContextDecorator):
     """Context manager that modifies environment variables."""
@@ -35,43 +41,14 @@ class custom_envs(ContextDecorator):
             new_environ (dict): a dictionary of new environment variables to
                 use.
         """
-        self.new_environ = new_environ
-        self.os_environ_original = os.environ.copy()
+        # The original values are restored when exiting.
+        self.patcher = patch.dict(os.environ, new_environ)
 
     def __enter__(self):
-        # Remove the original variables from `os.environ`.
-        modified_environ = {**os.environ, **self.new_environ}
-        os.environ = modified_environ
-
-    def __exit__(self, *exc):
-        os.environ = self.os_environ_original
-
-
-class no_envs(ContextDecorator):
-    """Context manager that disables environment variables."""
-
-    # pylint: disable=invalid-name
-
-    def __init__(self, vars_to_remove):
-        """no_envs constructor.
-
-        Args:
-            vars_to_remove (list): environment variables to remove.
-        """
-        self.vars_to_remove = vars_to_remove
-        self.os_environ_original = os.environ.copy()
-
-    def __enter__(self):
-        # Remove the original variables from `os.environ`.
-        modified_environ = {
-            key: value
-            for key, value in os.environ.items()
-            if key not in self.vars_to_remove
-        }
-        os.environ = modified_environ
+        self.patcher.start()
 
     def __exit__(self, *exc):
-        os.environ = self.os_environ_original
+        self.patcher.stop()
 
 
 class no_file(ContextDecorator):
@@ -99,34 +76,93 @@ class no_file(ContextDecorator):
 
 
 class temporary_account_config_file(ContextDecorator):
-    """Context manager that uses a temporary account configuration file."""
+    """Context manager that uses a temporary, in-memory account configuration."""
 
     # pylint: disable=invalid-name
 
     def __init__(self, contents=None, **kwargs):
-        # Create a temporary file with the contents.
+        if isinstance(contents, str):
+            raise TypeError(
+                "contents must be a dictionary of accounts, not a serialized string."
+            )
         contents = (
             contents if contents is not None else get_account_config_contents(**kwargs)
         )
-
-        self.tmp_file = NamedTemporaryFile(mode="w+")
-        json.dump(contents, self.tmp_file)
-        self.tmp_file.flush()
-        self.account_config_json_backup = (
-            AccountManager._default_account_config_json_file
+        # Serialize the contents once, the same way they would be stored on disk.
+        self.contents = self._dumps(contents)
+        self.data = self.contents
+        # Replace the functions used by `AccountManager` to access the file on disk.
+        self.patcher = patch.multiple(
+            "qiskit_ibm_provider.accounts.management",
+            read_config=self._read_config,
+            save_config=self._save_config,
+            delete_config=self._delete_config,
         )
 
     def __enter__(self):
-        # Temporarily modify the default location of the configuration file.
-        AccountManager._default_account_config_json_file = self.tmp_file.name
+        # Start from the initial contents, so the instance can be entered repeatedly.
+        self.data = self.contents
+        self.patcher.start()
         return self
 
     def __exit__(self, *exc):
-        # Delete the temporary file and restore the default location.
-        self.tmp_file.close()
-        AccountManager._default_account_config_json_file = (
-            self.account_config_json_backup
-        )
+        self.patcher.stop()
+
+    @staticmethod
+    def _dumps(contents):
+        """Serialize the configuration contents."""
+        # Read-only mappings, such as ``MappingProxyType``, are stored as dictionaries.
+        return json.dumps(contents, separators=(",", ":"), default=dict)
+
+    def _read_config(self, filename, name=None):
+        """In-memory version of ``read_config()``."""
+        # pylint: disable=unused-argument
+        data = json.loads(self.data)
+        if name is None:
+            return data
+        return data.get(name)
+
+    def _save_config(self, filename, name, config, overwrite):
+        """In-memory version of ``save_config()``."""
+        # pylint: disable=unused-argument
+        data = json.loads(self.data)
+        if data.get(name) and not overwrite:
+            raise AccountAlreadyExistsError(
+                f"Named account ({name}) already exists. "
+                f"Set overwrite=True to overwrite."
+            )
+        data[name] = config
+        self.data = self._dumps(data)
+
+    def _delete_config(self, filename, name):
+        """In-memory version of ``delete_config()``."""
+        # pylint: disable=unused-argument
+        data = json.loads(self.data)
+        if name in data:
+            del data[name]
+            self.data = self._dumps(data)
+            return True
+        return False
+
+
+@contextmanager
+def temporary_account_environment(remove_envs=None, **config_kwargs):
+    """Context manager that sets up both the environment and the account configuration.
+
+    Args:
+        remove_envs (list): environment variables to remove.
+        config_kwargs: arguments passed to ``temporary_account_config_file``.
+
+    Yields:
+        temporary_account_config_file: the temporary account configuration.
+    """
+    # The original environment variables are restored when exiting.
+    with patch.dict(os.environ), temporary_account_config_file(
+        **config_kwargs
+    ) as config:
+        for key in remove_envs or []:
+            os.environ.pop(key, None)
+        yield config
 
 
 def get_account_config_contents(
@@ -141,7 +177,7 @@ def get_account_config_contents(
     """Generate qiskitrc content"""
     if instance is None:
         instance = "hub/group/project"
-    token = token or uuid.uuid4().hex
+    token = token or get_dummy_token()
     if name is None:
         name = AccountManager._default_account_name_ibm_quantum
     if url is None:
@@ -159,3 +195,8 @@ def get_account_config_contents(
     if proxies is not None:
         out[name]["proxies"] = proxies
     return out
+
+
+def get_dummy_token():
+    """Return a dummy token from a pre-generated pool."""
+    return next(_DUMMY_TOKENS)
@@ -11,12 +11,14 @@
 # that they have been altered from the originals.
 
 """Tests for the account functions."""
-import json
 import logging
 import os
-import uuid
+import re
+from tempfile import TemporaryDirectory
+from types import MappingProxyType
 from typing import Any
-from unittest import skipIf
+
+from ddt import ddt, data, unpack
 
 from qiskit_ibm_provider.accounts import (
     AccountManager,
@@ -26,12 +28,14 @@ from qiskit_ibm_provider.accounts import (
     InvalidAccountError,
 )
 from qiskit_ibm_provider.accounts.account import IBM_QUANTUM_API_URL
+from qiskit_ibm_provider.accounts.storage import delete_config, read_config, save_config
 from qiskit_ibm_provider.proxies import ProxyConfiguration
 from .mock.fake_provider import FakeProvider
 from ..account import (
     temporary_account_config_file,
+    temporary_account_environment,
     custom_envs,
-    no_envs,
+    get_dummy_token,
 )
 from ..ibm_test_case import IBMTestCase
 
@@ -46,14 +50,28 @@ _TEST_IBM_QUANTUM_ACCOUNT = Account(
     instance="ibm-q/open/main",
 )
 
-_TEST_LEGACY_ACCOUNT = {
-    "auth": "legacy",
-    "token": "token-x",
-    "url": "https://auth.quantum-computing.ibm.com/api",
-    "instance": "ibm-q/open/main",
-}
+# Read-only, as they are shared by the tests.
+_SAVED_IBM_QUANTUM = MappingProxyType(_TEST_IBM_QUANTUM_ACCOUNT.to_saved_format())
+
+_TEST_LEGACY_ACCOUNT = MappingProxyType(
+    {
+        "auth": "legacy",
+        "token": "token-x",
+        "url": "https://auth.quantum-computing.ibm.com/api",
+        "instance": "ibm-q/open/main",
+    }
+)
+
 
+# Expected prefixes of the validation error messages.
+_INVALID_CHANNEL_RE = re.compile(r"^Invalid `channel` value\.")
+_INVALID_TOKEN_RE = re.compile(r"^Invalid `token` value\.")
+_INVALID_URL_RE = re.compile(r"^Invalid `url` value\.")
+_INVALID_INSTANCE_RE = re.compile(r"^Invalid `instance` value\.")
+_INVALID_PROXIES_RE = re.compile(r"^Invalid proxy configuration")
 
+
+@ddt
 class TestAccount(IBMTestCase):
     """Tests for Account class."""
 
@@ -65,88 +83,61 @@ class TestAccount(IBMTestCase):
 
         with self.assertRaises(InvalidAccountError) as err:
             invalid_channel: Any = "phantom"
-            Account(
-                channel=invalid_channel,
-                token=self.dummy_token,
-                url=self.dummy_ibm_quantum_url,
-            ).validate()
-        self.assertIn("Invalid `channel` value.", str(err.exception))
-
-    def test_invalid_token(self):
+            self._get_account(channel=invalid_channel).validate()
+        self.assertRegex(err.exception.message, _INVALID_CHANNEL_RE)
+
+    @data(1, None, "")
+    def test_invalid_token(self, token):
         """Test invalid values for token parameter."""
 
-        invalid_tokens = [1, None, ""]
-        for token in invalid_tokens:
-            with self.subTest(token=token):
-                with self.assertRaises(InvalidAccountError) as err:
-                    Account(
-                        channel="ibm_quantum",
-                        token=token,
-                        url=self.dummy_ibm_quantum_url,
-                    ).validate()
-                self.assertIn("Invalid `token` value.", str(err.exception))
-
-    def test_invalid_url(self):
+        with self.assertRaises(InvalidAccountError) as err:
+            self._get_account(token=token).validate()
+        self.assertRegex(err.exception.message, _INVALID_TOKEN_RE)
+
+    @data(123)
+    def test_invalid_url(self, url):
         """Test invalid values for url parameter."""
 
-        subtests = [
-            {"channel": "ibm_quantum", "url": 123},
-        ]
-        for params in subtests:
-            with self.subTest(params=params):
-                with self.assertRaises(InvalidAccountError) as err:
-                    Account(**params, token=self.dummy_token).validate()
-                self.assertIn("Invalid `url` value.", str(err.exception))
+        with self.assertRaises(InvalidAccountError) as err:
+            self._get_account(url=url).validate()
+        self.assertRegex(err.exception.message, _INVALID_URL_RE)
 
-    def test_invalid_instance(self):
+    @data("", "no-hgp-format", "hub/group", "hub/group/project/extra", "hub//project")
+    def test_invalid_instance(self, instance):
         """Test invalid values for instance parameter."""
 
-        subtests = [
-            {"channel": "ibm_quantum", "instance": ""},
-            {"channel": "ibm_quantum", "instance": "no-hgp-format"},
-        ]
-        for params in subtests:
-            with self.subTest(params=params):
-                with self.assertRaises(InvalidAccountError) as err:
-                    Account(
-                        **params, token=self.dummy_token, url=self.dummy_ibm_quantum_url
-                    ).validate()
-                self.assertIn("Invalid `instance` value.", str(err.exception))
-
-    def test_invalid_proxy_config(self):
+        with self.assertRaises(InvalidAccountError) as err:
+            self._get_account(instance=instance).validate()
+        self.assertRegex(err.exception.message, _INVALID_INSTANCE_RE)
+
+    @data(
+        {"username_ntlm": "user-only"},
+        {"password_ntlm": "password-only"},
+        {"urls": ""},
+    )
+    def test_invalid_proxy_config(self, proxy_params):
         """Test invalid values for proxy configuration."""
 
-        subtests = [
-            {
-                "proxies": ProxyConfiguration(**{"username_ntlm": "user-only"}),
-            },
-            {
-                "proxies": ProxyConfiguration(**{"password_ntlm": "password-only"}),
-            },
-            {
-                "proxies": ProxyConfiguration(**{"urls": ""}),
-            },
-        ]
-        for params in subtests:
-            with self.subTest(params=params):
-                with self.assertRaises(ValueError) as err:
-                    Account(
-                        **params,
-                        channel="ibm_quantum",
-                        token=self.dummy_token,
-                        url=self.dummy_ibm_quantum_url,
-                    ).validate()
-                self.assertIn("Invalid proxy configuration", str(err.exception))
-
-
-# NamedTemporaryFiles not supported in Windows
-@skipIf(os.name == "nt", "Test not supported in Windows")
+        with self.assertRaises(ValueError) as err:
+            self._get_account(proxies=ProxyConfiguration(**proxy_params)).validate()
+        self.assertRegex(str(err.exception), _INVALID_PROXIES_RE)
+
+    def _get_account(self, **kwargs):
+        """Return an account using dummy values for the parameters not specified."""
+        params = {
+            "channel": "ibm_quantum",
+            "token": self.dummy_token,
+            "url": self.dummy_ibm_quantum_url,
+        }
+        params.update(kwargs)
+        return Account(**params)
+
+
+@ddt
 class TestAccountManager(IBMTestCase):
     """Tests for AccountManager class."""
 
-    @temporary_account_config_file(
-        contents={"conflict": _TEST_IBM_QUANTUM_ACCOUNT.to_saved_format()}
-    )
+    @temporary_account_config_file(contents={"conflict": _SAVED_IBM_QUANTUM})
     def test_save_without_override(self):
         """Test to override an existing account without setting overwrite=True."""
         with self.assertRaises(AccountAlreadyExistsError):
@@ -160,10 +151,10 @@ class TestAccountManager(IBMTestCase):
             )
         # TODO remove test when removing auth parameter
 
-    @temporary_account_config_file(
-        contents={_DEFAULT_ACCOUNT_NAME_LEGACY: _TEST_LEGACY_ACCOUNT}
+    @temporary_account_environment(
+        remove_envs=["QISKIT_IBM_TOKEN"],
+        contents={_DEFAULT_ACCOUNT_NAME_LEGACY: _TEST_LEGACY_ACCOUNT},
     )
-    @no_envs(["QISKIT_IBM_TOKEN"])
     def test_save_channel_ibm_quantum_over_auth_legacy_without_overwrite(self):
         """Test to overwrite an existing auth "legacy" account with channel "ibm_quantum"
         and without setting overwrite=True."""
@@ -178,10 +169,10 @@ class TestAccountManager(IBMTestCase):
             )
 
     # TODO remove test when removing auth parameter
-    @temporary_account_config_file(
-        contents={_DEFAULT_ACCOUNT_NAME_LEGACY: _TEST_LEGACY_ACCOUNT}
+    @temporary_account_environment(
+        remove_envs=["QISKIT_IBM_TOKEN"],
+        contents={_DEFAULT_ACCOUNT_NAME_LEGACY: _TEST_LEGACY_ACCOUNT},
     )
-    @no_envs(["QISKIT_IBM_TOKEN"])
     def test_save_channel_ibm_quantum_over_auth_legacy_with_overwrite(self):
         """Test to overwrite an existing auth "elegacy" account with channel "ibm_quantum"
         and with setting overwrite=True."""
@@ -197,93 +188,61 @@ class TestAccountManager(IBMTestCase):
             _TEST_IBM_QUANTUM_ACCOUNT, AccountManager.get(channel="ibm_quantum")
         )
 
-    @temporary_account_config_file(
-        contents={"conflict": _TEST_IBM_QUANTUM_ACCOUNT.to_saved_format()}
-    )
+    @temporary_account_config_file(contents={"conflict": _SAVED_IBM_QUANTUM})
     def test_get_none(self):
         """Test to get an account with an invalid name."""
         with self.assertRaises(AccountNotFoundError):
             AccountManager.get(name="bla")
 
-    @temporary_account_config_file(contents={})
-    @no_envs(["QISKIT_IBM_TOKEN"])
-    def test_save_get(self):
-        """Test save and get."""
-
-        # Each tuple contains the
-        # - account to save
-        # - the name passed to AccountManager.save
-        # - the name passed to AccountManager.get
-        sub_tests = [
-            (_TEST_IBM_QUANTUM_ACCOUNT, "acct-1", "acct-1"),
-            # verify default account name handling for ibm_quantum accounts
-            (
-                _TEST_IBM_QUANTUM_ACCOUNT,
-                None,
-                _DEFAULT_ACCOUNT_NAME_IBM_QUANTUM,
-            ),
-            # verify account override
-            (_TEST_IBM_QUANTUM_ACCOUNT, "acct", "acct"),
-        ]
-        for account, name_save, name_get in sub_tests:
-            with self.subTest(
-                f"for account type '{account.channel}' "
-                f"using `save(name={name_save})` and `get(name={name_get})`"
-            ):
-                AccountManager.save(
-                    token=account.token,
-                    url=account.url,
-                    instance=account.instance,
-                    channel=account.channel,
-                    proxies=account.proxies,
-                    verify=account.verify,
-                    name=name_save,
-                    overwrite=True,
-                )
-                self.assertEqual(account, AccountManager.get(name=name_get))
-
-    @temporary_account_config_file(
-        contents=json.dumps(
-            {
-                "ibm_quantum": _TEST_IBM_QUANTUM_ACCOUNT.to_saved_format(),
-            }
-        )
+    # Each tuple contains the
+    # - account to save
+    # - the name passed to AccountManager.save
+    # - the name passed to AccountManager.get
+    @data(
+        (_TEST_IBM_QUANTUM_ACCOUNT, "acct-1", "acct-1"),
+        # verify default account name handling for ibm_quantum accounts
+        (_TEST_IBM_QUANTUM_ACCOUNT, None, _DEFAULT_ACCOUNT_NAME_IBM_QUANTUM),
+        # verify account override
+        (_TEST_IBM_QUANTUM_ACCOUNT, "acct", "acct"),
     )
-    def test_list(self):
-        """Test list."""
+    @unpack
+    @temporary_account_environment(remove_envs=["QISKIT_IBM_TOKEN"], contents={})
+    def test_save_get(self, account, name_save, name_get):
+        """Test save and get."""
+        AccountManager.save_account(account, name=name_save, overwrite=True)
+        self.assertEqual(account, AccountManager.get(name=name_get))
 
-        with temporary_account_config_file(
-            contents={
-                "key2": _TEST_IBM_QUANTUM_ACCOUNT.to_saved_format(),
-            }
-        ), self.subTest("non-empty list of accounts"):
-            accounts = AccountManager.list()
+    @temporary_account_config_file(contents={"key2": _SAVED_IBM_QUANTUM})
+    def test_list_nonempty(self):
+        """Test list with a non-empty list of accounts."""
+        accounts = AccountManager.list()
 
-            self.assertEqual(len(accounts), 1)
-            self.assertTrue(accounts["key2"], _TEST_IBM_QUANTUM_ACCOUNT)
+        self.assertEqual(len(accounts), 1)
+        self.assertEqual(accounts["key2"], _TEST_IBM_QUANTUM_ACCOUNT)
 
-        with temporary_account_config_file(contents={}), self.subTest(
-            "empty list of accounts"
-        ):
-            self.assertEqual(len(AccountManager.list()), 0)
-
-        with temporary_account_config_file(
-            contents={
-                "key2": _TEST_IBM_QUANTUM_ACCOUNT.to_saved_format(),
-                _DEFAULT_ACCOUNT_NAME_IBM_QUANTUM: Account(
-                    "ibm_quantum", "token-ibm-quantum"
-                ).to_saved_format(),
-            }
-        ), self.subTest("filtered list of accounts"):
+    @temporary_account_config_file(contents={})
+    def test_list_empty(self):
+        """Test list with an empty list of accounts."""
+        self.assertEqual(len(AccountManager.list()), 0)
 
-            accounts = list(AccountManager.list(channel="ibm_quantum").keys())
-            self.assertEqual(len(accounts), 2)
-            self.assertListEqual(accounts, ["key2", _DEFAULT_ACCOUNT_NAME_IBM_QUANTUM])
+    @temporary_account_config_file(
+        contents={
+            "key2": _SAVED_IBM_QUANTUM,
+            _DEFAULT_ACCOUNT_NAME_IBM_QUANTUM: Account(
+                "ibm_quantum", "token-ibm-quantum"
+            ).to_saved_format(),
+        }
+    )
+    def test_list_filtered(self):
+        """Test list with a filtered list of accounts."""
+        accounts = list(AccountManager.list(channel="ibm_quantum"))
+        self.assertEqual(len(accounts), 2)
+        self.assertListEqual(accounts, ["key2", _DEFAULT_ACCOUNT_NAME_IBM_QUANTUM])
 
     @temporary_account_config_file(
         contents={
-            "key1": _TEST_IBM_QUANTUM_ACCOUNT.to_saved_format(),
-            _DEFAULT_ACCOUNT_NAME_IBM_QUANTUM: _TEST_IBM_QUANTUM_ACCOUNT.to_saved_format(),
+            "key1": _SAVED_IBM_QUANTUM,
+            _DEFAULT_ACCOUNT_NAME_IBM_QUANTUM: _SAVED_IBM_QUANTUM,
         }
     )
     def test_delete(self):
@@ -296,7 +255,7 @@ class TestAccountManager(IBMTestCase):
         with self.subTest("delete default ibm_quantum account"):
             self.assertTrue(AccountManager.delete())
 
-        self.assertTrue(len(AccountManager.list()) == 0)
+        self.assertEqual(len(AccountManager.list()), 0)
 
     @temporary_account_config_file(
         contents={
@@ -314,23 +273,65 @@ class TestAccountManager(IBMTestCase):
         with self.subTest("delete default auth='legacy' account using channel"):
             self.assertTrue(AccountManager.delete())
 
-        self.assertTrue(len(AccountManager.list()) == 0)
+        self.assertEqual(len(AccountManager.list()), 0)
+
+
+class TestAccountStorage(IBMTestCase):
+    """Tests for the account configuration storage functions."""
+
+    def test_save_read_delete(self):
+        """Test saving, reading and deleting an account in a configuration file."""
+        with TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "qiskit-ibm.json")
+            self.assertEqual(read_config(filename=filename), {})
+
+            save_config(
+                filename=filename,
+                name="acct",
+                config=dict(_SAVED_IBM_QUANTUM),
+                overwrite=False,
+            )
+            self.assertEqual(
+                read_config(filename=filename, name="acct"), _SAVED_IBM_QUANTUM
+            )
+
+            self.assertTrue(delete_config(filename=filename, name="acct"))
+            self.assertIsNone(read_config(filename=filename, name="acct"))
+            self.assertFalse(delete_config(filename=filename, name="acct"))
 
 
 MOCK_PROXY_CONFIG_DICT = {
     "urls": {"https": "127.0.0.1", "username_ntlm": "", "password_ntlm": ""}
 }
 
+MOCK_PREFERENCES = [
+    {"proxies": MOCK_PROXY_CONFIG_DICT},
+    {"verify": False},
+    {"instance": "h/g/p"},
+    {"proxies": MOCK_PROXY_CONFIG_DICT, "verify": False, "instance": "h/g/p"},
+]
+
+
 # TODO: update and reenable test cases to work with qiskit-ibm-provider
-# NamedTemporaryFiles not supported in Windows
-@skipIf(os.name == "nt", "Test not supported in Windows")
+@ddt
 class TestEnableAccount(IBMTestCase):
     """Tests for IBMRuntimeService enable account."""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.dummy_token = get_dummy_token()
+        cls.dummy_url = get_dummy_token()
+        cls.dummy_envs = {
+            "QISKIT_IBM_TOKEN": cls.dummy_token,
+            "QISKIT_IBM_URL": cls.dummy_url,
+            "QISKIT_IBM_INSTANCE": "h/g/p",
+        }
+
     def test_enable_account_by_name(self):
         """Test initializing account by name."""
         name = "foo"
-        token = uuid.uuid4().hex
+        token = self.dummy_token
         with temporary_account_config_file(name=name, token=token):
             service = FakeProvider(name=name)
 
@@ -339,7 +340,7 @@ class TestEnableAccount(IBMTestCase):
 
     def test_enable_account_by_token_url(self):
         """Test initializing account by token or url."""
-        token = uuid.uuid4().hex
+        token = self.dummy_token
         subtests = [
             {"token": token},
             {"token": token, "url": "some_url"},
@@ -362,23 +363,26 @@ class TestEnableAccount(IBMTestCase):
         ]
 
         name = "foo"
-        token = uuid.uuid4().hex
-        for param in subtests:
-            with self.subTest(param=param), temporary_account_config_file(
-                name=name, token=token
-            ):
-                with self.assertLogs("qiskit_ibm_provider", logging.WARNING) as logged:
-                    service = FakeProvider(name=name, **param)
+        token = self.dummy_token
+        with temporary_account_config_file(name=name, token=token):
+            for param in subtests:
+                with self.subTest(param=param):
+                    with self.assertLogs(
+                        "qiskit_ibm_provider", logging.WARNING
+                    ) as logged:
+                        service = FakeProvider(name=name, **param)
 
-                self.assertTrue(service._account)
-                self.assertEqual(service._account.token, token)
-                self.assertIn("are ignored", logged.output[0])
+                    self.assertTrue(service._account)
+                    self.assertEqual(service._account.token, token)
+                    self.assertIn("are ignored", logged.output[0])
 
     def test_enable_account_by_token_url_2(self):
         """Test initializing ibm quantum account by  token, url."""
 
-        token = uuid.uuid4().hex
-        with temporary_account_config_file(token=token), no_envs(["QISKIT_IBM_TOKEN"]):
+        token = self.dummy_token
+        with temporary_account_environment(
+            remove_envs=["QISKIT_IBM_TOKEN"], token=token
+        ):
             with self.assertLogs("qiskit_ibm_provider", logging.WARNING) as logged:
                 service = FakeProvider(url="some_url")
 
@@ -390,8 +394,10 @@ class TestEnableAccount(IBMTestCase):
 
     def test_enable_account_by_only_channel(self):
         """Test initializing account with single saved account."""
-        token = uuid.uuid4().hex
-        with temporary_account_config_file(token=token), no_envs(["QISKIT_IBM_TOKEN"]):
+        token = self.dummy_token
+        with temporary_account_environment(
+            remove_envs=["QISKIT_IBM_TOKEN"], token=token
+        ):
             service = FakeProvider()
         self.assertTrue(service._account)
         self.assertEqual(service._account.token, token)
@@ -402,19 +408,12 @@ class TestEnableAccount(IBMTestCase):
     def test_enable_account_by_env_auth(self):
         """Test initializing account by environment variable and auth."""
 
-        token = uuid.uuid4().hex
-        url = uuid.uuid4().hex
-        envs = {
-            "QISKIT_IBM_TOKEN": token,
-            "QISKIT_IBM_URL": url,
-            "QISKIT_IBM_INSTANCE": "h/g/p",
-        }
-        with custom_envs(envs):
+        with custom_envs(self.dummy_envs):
             service = FakeProvider()
 
         self.assertTrue(service._account)
-        self.assertEqual(service._account.token, token)
-        self.assertEqual(service._account.url, url)
+        self.assertEqual(service._account.token, self.dummy_token)
+        self.assertEqual(service._account.url, self.dummy_url)
         self.assertEqual(service._account.channel, "ibm_quantum")
 
     def test_enable_account_bad_name(self):
@@ -426,43 +425,22 @@ class TestEnableAccount(IBMTestCase):
             _ = FakeProvider(name=name)
         self.assertIn(name, str(err.exception))
 
-    def test_enable_account_by_name_pref(self):
+    @data(*MOCK_PREFERENCES)
+    def test_enable_account_by_name_pref(self, extra):
         """Test initializing account by name and preferences."""
         name = "foo"
-        subtests = [
-            {"proxies": MOCK_PROXY_CONFIG_DICT},
-            {"verify": False},
-            {"instance": "h/g/p"},
-            {"proxies": MOCK_PROXY_CONFIG_DICT, "verify": False, "instance": "h/g/p"},
-        ]
-        for extra in subtests:
-            with self.subTest(extra=extra):
-                with temporary_account_config_file(name=name, verify=True, proxies={}):
-                    service = FakeProvider(name=name, **extra)
-                self.assertTrue(service._account)
-                self._verify_prefs(extra, service._account)
+        with temporary_account_config_file(name=name, verify=True, proxies={}):
+            service = FakeProvider(name=name, **extra)
+        self.assertTrue(service._account)
+        self._verify_prefs(extra, service._account)
 
-    def test_enable_account_by_env_pref(self):
+    @data(*MOCK_PREFERENCES)
+    def test_enable_account_by_env_pref(self, extra):
         """Test initializing account by environment variable and preferences."""
-        subtests = [
-            {"proxies": MOCK_PROXY_CONFIG_DICT},
-            {"verify": False},
-            {"instance": "h/g/p"},
-            {"proxies": MOCK_PROXY_CONFIG_DICT, "verify": False, "instance": "h/g/p"},
-        ]
-        for extra in subtests:
-            with self.subTest(extra=extra):
-                token = uuid.uuid4().hex
-                url = uuid.uuid4().hex
-                envs = {
-                    "QISKIT_IBM_TOKEN": token,
-                    "QISKIT_IBM_URL": url,
-                    "QISKIT_IBM_INSTANCE": "h/g/p",
-                }
-                with custom_envs(envs):
-                    service = FakeProvider(**extra)
-                self.assertTrue(service._account)
-                self._verify_prefs(extra, service._account)
+        with custom_envs(self.dummy_envs):
+            service = FakeProvider(**extra)
+        self.assertTrue(service._account)
+        self._verify_prefs(extra, service._account)
 
     def test_enable_account_by_name_input_instance(self):
         """Test initializing account by name and input instance."""